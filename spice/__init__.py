@@ -34,7 +34,6 @@ import os
 import sys
 import subprocess
 import shlex
-import pdb
 import shutil
 import time
 import traceback
@@ -471,6 +470,9 @@ class spice(spice_common):
         NOTE: Eldo seems to force output names to uppercase, let's
         uppercase everything here to avoid key mismatches. (This should be changed).
 
+        The values are Nx2 arrays of (time, value) rows stored in column-major
+        order, i.e. the time and value columns are both contiguous.
+
         """
         if not hasattr(self, '_iofile_eventdict'):
             self._iofile_eventdict=dict()
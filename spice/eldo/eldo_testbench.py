@@ -13,7 +13,6 @@ import shlex
 import fileinput
 from thesdk import *
 from spice.testbench_common import testbench_common
-import pdb
 
 import numpy as np
 import pandas as pd
@@ -276,17 +275,16 @@ class eldo_testbench(testbench_common):
                                         trig = val.trigger
                                     # Extracting the bus width
                                     signame = val.ionames[i]
-                                    busstart,busstop,buswidth,busrange = self.parent.get_buswidth(signame)
-                                    signame = signame.replace('<',' ').replace('>',' ').replace('[',' ').replace(']',' ').replace(':',' ').split(' ')
+                                    busname,busstart,busstop,buswidth,busrange = self.parent.parse_busname(signame)
                                     # If not already, add the respective trigger signal voltage to iofile_eventdict
                                     if trig not in self.parent.iofile_eventdict:
                                         self.parent.iofile_eventdict[trig] = None
                                         self._plotcmd += '.printfile %s(%s) file=%s\n' % (val.sourcetype,self.esc_bus(trig),val.file[i])
                                     for j in busrange:
                                         if buswidth == 1 and '<' not in val.ionames[i]:
-                                            bitname = signame[0]
+                                            bitname = busname
                                         else:
-                                            bitname = '%s<%d>' % (signame[0],j)
+                                            bitname = '%s<%d>' % (busname,j)
                                         # If not already, add the bit voltage to iofile_eventdict
                                         if bitname not in self.parent.iofile_eventdict:
                                             self.parent.iofile_eventdict[bitname] = None
@@ -13,7 +13,6 @@ import shlex
 import fileinput
 from thesdk import *
 from spice.testbench_common import testbench_common
-import pdb
 
 import numpy as np
 import pandas as pd
@@ -175,49 +174,46 @@ class ngspice_testbench(testbench_common):
                                     )
                             elif (('<' in val.ionames[i]) 
                                     and ('>' in val.ionames[i])):
-                                signame = val.ionames[i]
-                                signame = signame.replace('<',' ').replace('>',' ').replace('[',' ').replace(']',' ').replace(':',' ').split(' ')
-                                busstart = int(signame[1])
-                                busstop = int(signame[2])
+                                busname,busstart,busstop,buswidth,busrange = self.parent.parse_busname(val.ionames[i])
                                 loopstart=np.amin([busstart,busstop])
                                 loopstop=np.amax([busstart,busstop])
                                 self._inputsignals += ( 'a%s [ '
-                                        % ( signame[0])
+                                        % ( busname)
                                         )
 
                                 for index in range(loopstart,loopstop+1):
                                     self._inputsignals += ( '%s_%s_d '
-                                        % ( signame[0], index)
+                                        % ( busname, index)
                                         )
 
                                 self._inputsignals += ( '] input_vector_%s\n'
-                                        % ( signame[0])
+                                        % ( busname)
                                         )
 
                                 # Ngsim assumes lowercase filenames
                                 self._inputsignals += (
                                         '.model input_vector_%s d_source(input_file = %s)\n'
-                                        % ( signame[0], os.path.basename(val.file[i]).lower() )
+                                        % ( busname, os.path.basename(val.file[i]).lower() )
                                         ) 
 
                                 # DAC
-                                self._inputsignals += ( 'adac_%s [ ' % ( signame[0]) )
+                                self._inputsignals += ( 'adac_%s [ ' % ( busname) )
 
                                 for index in range(loopstart,loopstop+1):
                                     self._inputsignals += ( '%s_%s_d '
-                                            % ( signame[0], index))
+                                            % ( busname, index))
                                 self._inputsignals += ( '] [ ' )
 
                                 for index in range(loopstart,loopstop+1):
                                     self._inputsignals += (
-                                                '%s_%s_ ' % ( signame[0], index)
+                                                '%s_%s_ ' % ( busname, index)
                                             )
                                 self._inputsignals += (
-                                            '] dac_%s\n' % ( signame[0])
+                                            '] dac_%s\n' % ( busname)
                                         )
                                 self._inputsignals += (
                                     '.model dac_%s dac_bridge(out_low = %s out_high = %s out_undef = %s input_load = 5.0e-16 t_rise = %s t_fall = %s' %
-                                    (signame[0], val.vlo, val.vhi, (val.vhi+val.vlo)/2,
+                                    (busname, val.vlo, val.vhi, (val.vhi+val.vlo)/2,
                                         val.trise, val.tfall )
                                     )
                             else:
@@ -358,8 +354,7 @@ class ngspice_testbench(testbench_common):
                                         trig = val.trigger
                                     # Extracting the bus width
                                     signame = val.ionames[i]
-                                    busstart,busstop,buswidth,busrange = self.parent.get_buswidth(signame)
-                                    signame = signame.replace('<',' ').replace('>',' ').replace('[',' ').replace(']',' ').replace(':',' ').split(' ')
+                                    busname,busstart,busstop,buswidth,busrange = self.parent.parse_busname(signame)
                                     # If not already, add the respective trigger signal voltage to iofile_eventdict
                                     if trig not in self.parent.iofile_eventdict:
                                         self.parent.iofile_eventdict[trig] = None
@@ -371,9 +366,9 @@ class ngspice_testbench(testbench_common):
                                                 (val.file[i],val.sourcetype,trig.upper())
                                     for j in busrange:
                                         if buswidth == 1 and '<' not in val.ionames[i]:
-                                            bitname = signame[0]
+                                            bitname = busname
                                         else:
-                                            bitname = '%s<%d>' % (signame[0],j)
+                                            bitname = '%s<%d>' % (busname,j)
                                         # If not already, add the bit voltage to iofile_eventdict
                                         if bitname not in self.parent.iofile_eventdict:
                                             self.parent.iofile_eventdict[bitname] = None
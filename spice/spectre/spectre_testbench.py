@@ -15,7 +15,6 @@ import re
 
 from thesdk import *
 from spice.testbench_common import testbench_common
-import pdb
 
 import numpy as np
 import pandas as pd
@@ -23,6 +22,9 @@ from functools import reduce
 import textwrap
 from datetime import datetime
 
+# Bus range of an IO name, e.g. 'BUS<7:0>'
+_bus_range_match = re.compile(r'<([0-9]+):([0-9]+)>')
+
 class spectre_testbench(testbench_common):
     def __init__(self, parent=None, **kwargs):
         ''' Executes init of testbench_common, thus having the same attributes and 
@@ -333,30 +335,41 @@ class spectre_testbench(testbench_common):
                     savestr=''
                     plotstr=''
                     first=True
+                    # Loop invariant, bound once
+                    eventdict=self.parent.iofile_eventdict
+                    esc_bus=self.esc_bus
+                    # Print tokens already in plotstr, for the duplicate check
+                    printed=set()
                     for name, val in self.iofiles.Members.items():
                         # Output iofile becomes a plot/print command
                         if val.dir.lower()=='out' or val.dir.lower()=='output':
                             if val.iotype=='event':
                                 for i in range(len(val.ionames)):
-                                    signame = self.esc_bus(val.ionames[i])
+                                    signame = esc_bus(val.ionames[i])
                                     if first:
                                         savestr += 'save %s' % signame
                                         if val.datatype.lower() == 'complex':
                                             plotstr += '.print %sr(%s) %si(%s)' % \
                                                     (val.sourcetype, val.ionames[i], val.sourcetype, val.ionames[i])
+                                            printed.update(('%sr(%s)' % (val.sourcetype, val.ionames[i]),
+                                                '%si(%s)' % (val.sourcetype, val.ionames[i])))
                                         else:
                                             plotstr += '.print %s(%s)' % (val.sourcetype, val.ionames[i])
+                                            printed.add('%s(%s)' % (val.sourcetype, val.ionames[i]))
                                         first=False
                                     else:
                                         if val.datatype.lower() == 'complex':
-                                            if f'{val.sourcetype}({val.ionames[i]})' not in plotstr.split(' '):
+                                            if f'{val.sourcetype}({val.ionames[i]})' not in printed:
                                                 savestr += ' %s' % signame
                                                 plotstr += ' %sr(%s) %si(%s)' % \
                                                         (val.sourcetype, val.ionames[i], val.sourcetype, val.ionames[i])
+                                                printed.update(('%sr(%s)' % (val.sourcetype, val.ionames[i]),
+                                                    '%si(%s)' % (val.sourcetype, val.ionames[i])))
                                         else:
-                                            if f'{val.sourcetype}({val.ionames[i]})' not in plotstr.split(' '):
+                                            if f'{val.sourcetype}({val.ionames[i]})' not in printed:
                                                 savestr += ' %s' % signame
                                                 plotstr += ' %s(%s)' % (val.sourcetype, val.ionames[i])
+                                                printed.add('%s(%s)' % (val.sourcetype, val.ionames[i]))
                             elif val.iotype=='sample':
                                 for i in range(len(val.ionames)):
                                     # Checking the given trigger(s)
@@ -372,44 +385,45 @@ class spectre_testbench(testbench_common):
                                         trig = val.trigger
                                     # Extracting the bus width
                                     signame = val.ionames[i]
-                                    busstart,busstop,buswidth,busrange = self.parent.get_buswidth(signame)
-                                    signame = signame.replace('<',' ').replace('>',' ').replace('[',' ').replace(']',' ').replace(':',' ').split(' ')
+                                    busname,busstart,busstop,buswidth,busrange = self.parent.parse_busname(signame)
                                     # If not already, add the respective trigger signal voltage to iofile_eventdict
-                                    if trig not in self.parent.iofile_eventdict:
-                                        self.parent.iofile_eventdict[trig] = None
+                                    if trig not in eventdict:
+                                        eventdict[trig] = None
                                         if first:
-                                            savestr += 'save %s' % self.esc_bus(trig)
+                                            savestr += 'save %s' % esc_bus(trig)
                                             plotstr += '.print v(%s)' % (trig)
                                             first=False
                                         else:
-                                            savestr += ' %s' % self.esc_bus(trig) 
+                                            savestr += ' %s' % esc_bus(trig)
                                             plotstr += ' v(%s)' % (trig)
+                                        printed.add('v(%s)' % (trig))
                                     for j in busrange:
                                         if buswidth == 1 and '<' not in val.ionames[i]:
-                                            bitname = signame[0]
+                                            bitname = busname
                                         else:
-                                            bitname = '%s<%d>' % (signame[0],j)
+                                            bitname = '%s<%d>' % (busname,j)
                                         # If not already, add the bit voltage to iofile_eventdict
-                                        if bitname not in self.parent.iofile_eventdict:
-                                            self.parent.iofile_eventdict[bitname] = None
+                                        if bitname not in eventdict:
+                                            eventdict[bitname] = None
                                             if first:
-                                                savestr += 'save %s' % self.esc_bus(bitname)
+                                                savestr += 'save %s' % esc_bus(bitname)
                                                 plotstr += '.print %s(%s)' % (val.sourcetype, bitname)
                                                 first=False
                                             else:
-                                                savestr += ' %s' % self.esc_bus(bitname)
+                                                savestr += ' %s' % esc_bus(bitname)
                                                 plotstr += ' %s(%s)' % (val.sourcetype, bitname)
+                                            printed.add('%s(%s)' % (val.sourcetype, bitname))
                             elif val.iotype=='time':
                                 # For time IOs, the node voltage is saved as
                                 # event and the time information is later
                                 # parsed in Python
                                 for i in range(len(val.ionames)):
-                                    signame = self.esc_bus(val.ionames[i])
+                                    signame = esc_bus(val.ionames[i])
                                     # Check if this same node was already saved as event type
-                                    if val.ionames[i] not in self.parent.iofile_eventdict:
+                                    if val.ionames[i] not in eventdict:
                                         # Requested node was not saved as event
                                         # -> add to eventdict + save to output database
-                                        self.parent.iofile_eventdict[val.ionames[i]] = None
+                                        eventdict[val.ionames[i]] = None
                                         if first:
                                             savestr += 'save %s' % signame
                                             plotstr += '.print %s(%s)' % (val.sourcetype, val.ionames[i])
@@ -417,6 +431,7 @@ class spectre_testbench(testbench_common):
                                         else:
                                             savestr += ' %s' % signame
                                             plotstr += ' %s(%s)' % (val.sourcetype, val.ionames[i])
+                                        printed.add('%s(%s)' % (val.sourcetype, val.ionames[i]))
                             elif val.iotype=='vsample':
                                 self.print_log(type='O',msg='IO type \'vsample\' is obsolete. Please use type \'sample\' and set ioformat=\'volt\'.')
                                 self.print_log(type='F',msg='Please do it now :)')
@@ -428,8 +443,8 @@ class spectre_testbench(testbench_common):
                     for name, val in self.dcsources.Members.items():
                         if val.extract:
                             supply = '%s%s' % (val.sourcetype.upper(),val.name.upper())
-                            if supply not in self.parent.iofile_eventdict:
-                                self.parent.iofile_eventdict[supply] = None
+                            if supply not in eventdict:
+                                eventdict[supply] = None
                             if first:
                                 savestr += 'save %s:pwr %s:p' % (supply,supply)
                                 plotstr += '.print I(%s)' % (supply)
@@ -472,18 +487,15 @@ class spectre_testbench(testbench_common):
                 if val.dir.lower() == 'out':
                     for io_name in val.ionames:
                         num_addition=2 if val.datatype.lower()=='complex' else 1
-                        pattern=re.compile('<[0-9]+:[0-9]+>')
-                        if pattern.search(io_name):
-                            start=io_name.split('<')[1]
-                            start=start.split(':')
-                            lower=start[0]
-                            higher=start[1].split('>')[0]
+                        busrange=_bus_range_match.search(io_name)
+                        if busrange:
+                            lower,higher=busrange.groups()
                             add=abs(int(higher)-int(lower))+1
                             self._num_cols += num_addition*add 
                         else:
                             self._num_cols += num_addition 
-        self._num_cols *= 15
-        return self._num_cols
+        # The column count is kept, the width is derived on each access
+        return self._num_cols*15
 
     @num_cols.setter
     def num_cols(self, val):
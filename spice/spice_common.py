@@ -13,7 +13,6 @@ import shlex
 import fileinput
 from thesdk import *
 from spice.spice_methods import spice_methods
-import pdb
 
 class spice_common(spice_methods,thesdk):
     """
@@ -60,7 +59,7 @@ class spice_common(spice_methods,thesdk):
         '''
         Check if simulation was strobed or not
         '''
-        if not hasattr(self, '_is_strobed'):
+        if getattr(self, '_is_strobed', None) is None:
             self._is_strobed=False
             for simtype, simcmd in self.simcmd_bundle.Members.items():
                 if simtype=='tran':
@@ -75,9 +75,8 @@ class spice_dcsource(thesdk):
 
     """
 
-    @property
-    def _classfile(self):
-        return os.path.dirname(os.path.realpath(__file__)) + "/"+__name__
+    # Resolved once at import, the path does not change per instance
+    _classfile = os.path.dirname(os.path.realpath(__file__)) + "/"+__name__
 
     def __init__(self,parent,**kwargs):
         try:  
@@ -95,14 +94,16 @@ class spice_dcsource(thesdk):
             self.ramp=kwargs.get('ramp',0)
         except:
             self.print_log(type='F', msg="Spice DC source definition failed.")
+        parent = self.parent
         # This enables e.g. DC sweeps
         if isinstance(self.paramname, str): # Parameterized source
             if isinstance(self.paramname, str): # Cannot use string as default value, parameter value set by sweep
-                self.parent.spiceparameters.update({self.paramname: '0'})
+                parent.spiceparameters.update({self.paramname: '0'})
             else:
-                self.parent.spiceparameters.update({self.paramname:self.value})
-        if hasattr(self.parent,'dcsource_bundle'):
-            self.parent.dcsource_bundle.new(name=self.name,val=self)
+                parent.spiceparameters.update({self.paramname:self.value})
+        dcsource_bundle = getattr(parent,'dcsource_bundle',None)
+        if dcsource_bundle is not None:
+            dcsource_bundle.new(name=self.name,val=self)
 
     @property
     def ext_file(self):
@@ -14,7 +14,6 @@ import sys
 import subprocess
 import multiprocessing
 from time import sleep
-import pdb
 from abc import * 
 from thesdk import *
 from thesdk.iofile import iofile
@@ -24,6 +23,11 @@ from numpy import genfromtxt
 import traceback
 from bitstring import BitArray
 
+# Translation table for mapping ionames to filenames
+_file_trans = str.maketrans({'<':'','>':'','.':'_'})
+# Match one or more characters that are not ) and capture.
+_label_match = re.compile(r'\(([^)]+)\)')
+
 class spice_iofile(iofile):
     """
     Class to provide file IO for spice simulations. When created, 
@@ -165,18 +169,23 @@ class spice_iofile(iofile):
         files which are automatically handled together. These filepaths are set
         automatically.
         """
+        if not self.parent.load_output_file:
+            filepath = self.parent.spicesimpath+'/'
+        else:
+            filepath = self.parent.statedir
+        # The list is rebuilt only when something it depends on has changed
+        key = (tuple(self.ionames),self.dir,self.iotype,self.parent.model,self.parent.name,
+                self.parent.runname,filepath)
+        if getattr(self,'_file_key',None) == key:
+            return self._file
         self._file = []
         for ioname in self.ionames:
             if self.dir == 'out':
                 filename = 'tb_%s.print' % (self.parent.name)
             else:
                 filename = ( '%s_%s_%s_%s.txt' 
-                    % ( self.parent.runname,self.dir,ioname.replace('<','').replace('>','').replace('.','_'),
+                    % ( self.parent.runname,self.dir,ioname.translate(_file_trans),
                         self.iotype))
-            if not self.parent.load_output_file:
-                filepath = self.parent.spicesimpath+'/'
-            else:
-                filepath = self.parent.statedir
             # For now, all outputs are event type stored in a common file
             if self.parent.model == 'ngspice' and self.dir == 'in':
                 # For some reason Ngspice requires lowercase names
@@ -188,11 +197,13 @@ class spice_iofile(iofile):
             self._file=list(set(self._file))
         if len(self._file) < 1:
             self.print_log(type='W', msg='ionames property was empty for io with name %s' % self.name)
+        self._file_key = key
         return self._file
 
     @file.setter
     def file(self,val):
         self._file=val
+        self._file_key=None
         return self._file
 
     # Overloading ionames property to contain a list
@@ -226,16 +237,18 @@ class spice_iofile(iofile):
         if self.iotype == 'event':
             try:
                 data = self.Data
-                for i in range(len(self.file)):
-                    np.savetxt(self.file[i],data[:,[2*i,2*i+1]],delimiter=',')
-                    self.print_log(type='D',msg='Writing event input %s' % self.file[i])
+                files = self.file
+                for i in range(len(files)):
+                    np.savetxt(files[i],data[:,[2*i,2*i+1]],delimiter=',')
+                    self.print_log(type='D',msg='Writing event input %s' % files[i])
             except:
                     self.print_log(type='E',msg=traceback.format_exc())
-                    self.print_log(type='E',msg='Failed writing %s' % self.file[i])
+                    self.print_log(type='E',msg='Failed writing %s' % files[i])
         elif self.iotype == 'sample':
             try:
-                for i in range(len(self.file)):
-                    self.print_log(type='D',msg='Writing sample input %s' % self.file[i])
+                files = self.file
+                for i in range(len(files)):
+                    self.print_log(type='D',msg='Writing sample input %s' % files[i])
                     if not isinstance(self.Data,int):
                         # Input is a vector
                         if self.Data.ndim == 1:
@@ -247,44 +260,39 @@ class spice_iofile(iofile):
                         # Input is a scalar value
                         vec = [self.Data]
                     # Extracting the bus width
-                    signame = self.ionames[i]
-                    busstart,busstop,buswidth,busrange = self.parent.get_buswidth(signame)
-                    signame = signame.replace('<',' ').replace('>',' ').replace('[',' ').replace(']',' ').replace(':',' ').split(' ')
-                with open(self.file[i],'w') as outfile:
+                    busstart,busstop,buswidth,busrange = self.parent.get_buswidth(self.ionames[i])
+                with open(files[i],'w',buffering=1<<20) as outfile:
                     if self.parent.model == 'spectre':
                         # This is Spectre vector file syntax
-                        outfile.write('radix %s\n' % ('1 '*buswidth))
-                        outfile.write('io i\n')
-                        outfile.write('vname %s\n' % self.ionames[i].replace('<','<[').replace('>',']>'))
-                        outfile.write('tunit ns\n')
-                        outfile.write(f'period {1e9/float(self.rs)}\n')
-                        outfile.write(f'trise {float(self.trise)*1e9}\n')
-                        outfile.write(f'tfall {float(self.tfall)*1e9}\n')
-                        outfile.write(f'tdelay {float(self.after)*1e9}\n')
-                        outfile.write(f'vih {self.vhi}\n')
-                        outfile.write(f'vil {self.vlo}\n\n')
-                        for j in range(len(vec)):
-                            if self.ioformat == 'dec':
-                                # Input values are integer numbers (TODO: check if its unsigned)
-                                binary = format(vec[j],'0%db' % buswidth)
-                            else:
-                                # Input values  are bits (strings of '1' and '0')
-                                binary = vec[j]
-                            outfile.write('%s\n' % binary)
+                        bits = self._bus_bits(vec,buswidth)
+                        outfile.write(f'radix {"1 "*buswidth}\n'
+                                'io i\n'
+                                f'vname {self.ionames[i].replace("<","<[").replace(">","]>")}\n'
+                                'tunit ns\n'
+                                f'period {1e9/float(self.rs)}\n'
+                                f'trise {float(self.trise)*1e9}\n'
+                                f'tfall {float(self.tfall)*1e9}\n'
+                                f'tdelay {float(self.after)*1e9}\n'
+                                f'vih {self.vhi}\n'
+                                f'vil {self.vlo}\n\n')
+                        lines = np.ascontiguousarray(bits).view('<U%d' % buswidth).ravel()
+                        outfile.write('\n'.join(lines))
+                        outfile.write('\n')
                     if self.parent.model == 'ngspice':
                         # This is Ngsim vector file syntax
-                        for j in range(len(vec)):
-                            if self.ioformat == 'dec':
-                                # Input values are integer numbers (TODO: check if its unsigned)
-                                binary = format(vec[j],'0%db' % buswidth)
-                            else:
-                                # Input values  are bits (strings of '1' and '0')
-                                binary = vec[j]
-                            line = str(j/self.rs)+' '+'s '.join(binary)+'s'
-                            outfile.write('%s\n' % line)
+                        # Each bit is written as ' <bit>s' after the timestamp
+                        bits = self._bus_bits(vec,buswidth)
+                        words = np.empty(bits.shape+(3,),dtype='<U1')
+                        words[:,:,0] = ' '
+                        words[:,:,1] = bits
+                        words[:,:,2] = 's'
+                        lines = np.char.add((np.arange(len(bits))/self.rs).astype(str),
+                                words.reshape(len(bits),-1).view('<U%d' % (3*buswidth)).ravel())
+                        outfile.write('\n'.join(lines))
+                        outfile.write('\n')
             except:
                 self.print_log(type='E',msg=traceback.format_exc())
-                self.print_log(type='E',msg='Failed while writing files for %s' % self.file[i])
+                self.print_log(type='E',msg='Failed while writing files for %s' % files[i])
         else:
             pass
 
@@ -341,7 +349,6 @@ class spice_iofile(iofile):
         """
         if self.iotype=='event':
             file=self.file[0] # File is the same for all event type outputs
-            label_match=re.compile(r'\(([^)]+)\)') # Match one or more characters that are not ) and capture.
             if self.parent.model in ['spectre','ngspice']:
                 os.system('sync %s' % self.parent.spicesimpath)
                 block_count=subprocess.check_output('grep -n \"time\|freq\" %s | sed \'s/^\([0-9]\+\):/\\1|/\'' % file, shell=True).decode('utf-8')
@@ -364,7 +371,7 @@ class spice_iofile(iofile):
                             linenumbers.append(line)
                         except ValueError:
                             self.print_log(type='W', msg='Couldn\'t decode linenumber from file %s' %  file)
-                        labelgrp=label_match.findall(parts[1]) # Parse IO labels (nodenames)
+                        labelgrp=_label_match.findall(parts[1]) # Parse IO labels (nodenames)
                         if labelgrp:
                             tmp = list(dict.fromkeys(labelgrp))
                             labels.append(tmp)
@@ -420,7 +427,8 @@ class spice_iofile(iofile):
             elif self.parent.model == 'eldo':
                 # Parse signal headers
                 with open(file,'r') as f:
-                    for line in f.readlines():
+                    # Header is at the start of the file, stop reading once found
+                    for line in f:
                         if line.startswith('# TIME') or line.startswith('# FREQ'):
                             header = line.replace('# ','').replace('\n','').split(' ')
                             break
@@ -428,109 +436,122 @@ class spice_iofile(iofile):
                 if len(header) != len(arr[0,:]):
                     self.print_log(type='E', msg='Signal name and array column mismatch while reading event outputs.')
                 for col_idx,sname in enumerate(header[1:]):
-                    label=label_match.search(sname)
+                    label=_label_match.search(sname)
                     if label:
                         label = label.group(1)
-                        # Add to the event dictionary
-                        self.parent.iofile_eventdict[label.upper()]=np.hstack((arr[:,0].reshape(-1,1),arr[:,col_idx+1].reshape(-1,1))).reshape(-1,2)
+                        # Add to the event dictionary, column-major as in spectre
+                        self.parent.iofile_eventdict[label.upper()]=np.vstack((arr[:,0],arr[:,col_idx+1])).T
                     else:
                         self.print_log(type='W', msg='Label format mismatch with \'%s\'.' %  (label))
         else:
-            if len(self.file) == 0:
+            nfiles = len(self.file)
+            if nfiles == 0:
                 self.print_log(type='W', msg='No output file defined for IO %s. Check self.ionames!' % self.name)
-            for i in range(len(self.file)):
-                try:
-                    if self.iotype=='vsample':
-                        self.print_log(type='O',msg='IO type \'vsample\' is obsolete. Please use type \'sample\' and set ioformat=\'volt\'.')
-                        self.print_log(type='F',msg='Please do it now :)')
-                    elif self.iotype=='time':
-                        # TODO: Make sure all 'event' iofiles are parsed before 'time' iofiles
-                        if self.ionames[i].upper() in self.parent.iofile_eventdict:
-                            arr = self.parent.iofile_eventdict[self.ionames[i].upper()]
-                        else:
-                            self.print_log(type='E',msg='No event data found for %s while parsing time signal.' % self.ionames[i])
-                        # This should work for both spectre and eldo now
-                        if self.edgetype.lower() == 'both':
-                            trise = self.interp_crossings(arr,self.vth,256,'rising')
-                            tfall = self.interp_crossings(arr,self.vth,256,'falling')
-                            tcross = np.sort(np.vstack((trise.reshape(-1,1),tfall.reshape(-1,1))),0)
-                        else:
-                            tcross = self.interp_crossings(arr,self.vth,256,self.edgetype)
-                        nparr = np.array(tcross).reshape(-1,1)
-                        # Adding nparr to self.Data
-                        self.append_to_data(arr=nparr,bits=False)
-                    elif self.iotype=='sample':
-                        # Extracting the bus width
-                        signame = self.ionames[i]
-                        busstart,busstop,buswidth,busrange = self.parent.get_buswidth(signame)
-                        signame = signame.replace('<',' ').replace('>',' ').replace('[',' ').replace(']',' ').replace(':',' ').split(' ')
-
-                        # Find trigger signal threshold crossings
-                        if isinstance(self.trigger,list):
-                            if len(self.trigger) == len(self.ionames):
-                                trig = self.trigger[i]
-                            else:
-                                trig = self.trigger[0]
-                        else:
-                            trig = self.trigger
-                        if trig.upper() not in self.parent.iofile_eventdict:
-                            self.print_log(type='E',msg='Event data not found for trigger signal %s' % trig)
-                        else:
-                            trig_event = self.parent.iofile_eventdict[trig]
-                            tsamp = self.interp_crossings(trig_event,self.vth,256,self.edgetype)
-
-                        # Processing each bit in the bus
-                        self.print_log(type='D',msg='Sampling %s with %s (%s).'%(self.ionames[i],trig,self.edgetype))
-                        failed = False
-                        bitmat = None
-                        for j in busrange:
-                            # Get event data for the bit voltage
-                            if buswidth == 1 and '<' not in self.ionames[i]:
-                                bitname = signame[0]
-                            else:
-                                bitname = '%s<%d>' % (signame[0],j)
-                            if bitname.upper() not in self.parent.iofile_eventdict:
-                                event = np.array(['0']).reshape(-1,1)
-                                failed = True
-                            else:
-                                event = self.parent.iofile_eventdict[bitname.upper()]
-                            # Sample the signal
-                            arr = self.sample_signal(event,tsamp)
-                            # Binary or decimal io format, rounding to bits
-                            if self.ioformat != 'volt':
-                                if len(arr.shape) > 1:
-                                    arr = (arr[:,1]>=self.vth).reshape(-1,1).astype(int).astype(str)
-                                else:
-                                    arr = np.array(['0']).reshape(-1,1)
-                                    failed = True
-                            if bitmat is None:
-                                # First bit is read, it becomes the first column of the bit matrix
-                                bitmat = arr
-                            else:
-                                # Following bits get stacked as columns to the left of the previous one
-                                bitmat = np.hstack((bitmat,arr))
-                        if failed:
-                            self.print_log(type='W',msg='Failed reading sample type output vector.')
-                        if self.ioformat == 'volt':
-                            nparr = bitmat
-                        else:
-                            # Merging bits to buses
-                            arr = []
-                            for j in range(len(bitmat[:,0])):
-                                arr.append(''.join(bitmat[j,:]))
-                            nparr = np.array(arr).reshape(-1,1)
-                            # Convert binary strings to decimals
-                            if self.ioformat == 'dec':
-                                b2i = np.vectorize(self._bin2int)
-                                # For now only little-endian unsigned
-                                nparr = b2i(nparr)
-                        # Adding nparr to self.Data
-                        self.append_to_data(arr=nparr,bits=True,buswidth=buswidth)
+            # Arrays read from each file as (array,bits,buswidth), stacked to
+            # self.Data once all files are read
+            parts = []
+            try:
+                parts = [self._read_one(i) for i in range(nfiles)]
+            except:
+                self.print_log(type='E',msg=traceback.format_exc())
+                self.print_log(type='F',msg='Failed while reading files for %s.' % self.name)
+            parts = [part for part in parts if part is not None]
+            if len(parts) > 0:
+                # Adding the arrays to self.Data with a single stacking
+                nrows = max(arr.shape[0] for arr,bits,buswidth in parts)
+                self.append_to_data(arr=np.hstack([self._pad_rows(arr,nrows,bits,buswidth)
+                                                   for arr,bits,buswidth in parts]),
+                                    bits=parts[-1][1],buswidth=parts[-1][2])
+
+    def _read_one(self,i):
+        """ Helper method called by read() for 'time' and 'sample' type outputs.
+
+        Processes the event data of the i:th ioname. Returns a tuple
+        (array,bits,buswidth) to be added to self.Data.
+        """
+        if self.iotype=='vsample':
+            self.print_log(type='O',msg='IO type \'vsample\' is obsolete. Please use type \'sample\' and set ioformat=\'volt\'.')
+            self.print_log(type='F',msg='Please do it now :)')
+        elif self.iotype=='time':
+            # TODO: Make sure all 'event' iofiles are parsed before 'time' iofiles
+            if self.ionames[i].upper() in self.parent.iofile_eventdict:
+                arr = self.parent.iofile_eventdict[self.ionames[i].upper()]
+            else:
+                self.print_log(type='E',msg='No event data found for %s while parsing time signal.' % self.ionames[i])
+            # This should work for both spectre and eldo now
+            if self.edgetype.lower() == 'both':
+                trise = self.interp_crossings(arr,self.vth,256,'rising')
+                tfall = self.interp_crossings(arr,self.vth,256,'falling')
+                # Both are already in time order, merging instead of sorting
+                tcross = np.insert(trise,trise.searchsorted(tfall),tfall)
+            else:
+                tcross = self.interp_crossings(arr,self.vth,256,self.edgetype)
+            nparr = np.array(tcross).reshape(-1,1)
+            return nparr,False,None
+        elif self.iotype=='sample':
+            # Extracting the bus width
+            signame = self.ionames[i]
+            busname,busstart,busstop,buswidth,busrange = self.parent.parse_busname(signame)
+
+            # Find trigger signal threshold crossings
+            if isinstance(self.trigger,list):
+                if len(self.trigger) == len(self.ionames):
+                    trig = self.trigger[i]
+                else:
+                    trig = self.trigger[0]
+            else:
+                trig = self.trigger
+            if trig.upper() not in self.parent.iofile_eventdict:
+                self.print_log(type='E',msg='Event data not found for trigger signal %s' % trig)
+            else:
+                trig_event = self.parent.iofile_eventdict[trig]
+                tsamp = self.interp_crossings(trig_event,self.vth,256,self.edgetype)
+
+            # Processing each bit in the bus
+            self.print_log(type='D',msg='Sampling %s with %s (%s).'%(self.ionames[i],trig,self.edgetype))
+            failed = False
+            bit_columns = []
+            for j in busrange:
+                # Get event data for the bit voltage
+                if buswidth == 1 and '<' not in self.ionames[i]:
+                    bitname = busname
+                else:
+                    bitname = '%s<%d>' % (busname,j)
+                if bitname.upper() not in self.parent.iofile_eventdict:
+                    event = np.array(['0']).reshape(-1,1)
+                    failed = True
+                else:
+                    event = self.parent.iofile_eventdict[bitname.upper()]
+                # Sample the signal
+                arr = self.sample_signal(event,tsamp)
+                # Binary or decimal io format, rounding to bits
+                if self.ioformat != 'volt':
+                    if len(arr.shape) > 1:
+                        arr = (arr[:,1]>=self.vth).reshape(-1,1).astype(np.uint8)
                     else:
-                        self.print_log(type='F',msg='Couldn\'t read file for input type \'%s\'.'%self.iotype)
-                except:
-                    self.print_log(type='E',msg=traceback.format_exc())
-                    self.print_log(type='F',msg='Failed while reading files for %s.' % self.name)
+                        arr = np.zeros((1,1),dtype=np.uint8)
+                        failed = True
+                # Following bits get stacked as columns to the right of the previous one
+                bit_columns.append(arr)
+            bitmat = np.hstack(bit_columns)
+            if failed:
+                self.print_log(type='W',msg='Failed reading sample type output vector.')
+            if self.ioformat == 'volt':
+                nparr = bitmat
+            else:
+                # Merging bits to buses. Each row of single
+                # character strings is reinterpreted as one
+                # string of buswidth characters.
+                nparr = np.ascontiguousarray(bitmat.astype('<U1')).view(
+                        '<U%d' % bitmat.shape[1]).reshape(-1,1)
+                # Convert binary strings to decimals
+                if self.ioformat == 'dec':
+                    b2i = np.vectorize(self._bin2int)
+                    # For now only little-endian unsigned
+                    nparr = b2i(nparr)
+            return nparr,True,buswidth
+        else:
+            self.print_log(type='F',msg='Couldn\'t read file for input type \'%s\'.'%self.iotype)
 
     def interp_crossings(self,data,vth,nint,edgetype):
         """ Helper method called for 'time' and 'sample' type outputs.
@@ -560,29 +581,37 @@ class spice_iofile(iofile):
             1D-vector with time-stamps of interpolated threshold crossings.
 
         """
-        if edgetype.lower() == 'rising':
+        if data.ndim != 2 or data.shape[1] < 2:
+            self.print_log(type='F',msg='Expected event type data with time and value columns for %s.' % self.name)
+        rising = edgetype.lower() == 'rising'
+        if rising:
             edges = np.flatnonzero((data[:-1,1]<vth) & (data[1:,1]>=vth))+1
         else:
             edges = np.flatnonzero((data[:-1,1]>=vth) & (data[1:,1]<vth))+1
-        tcross = np.zeros((len(edges)))
-        # Potentially slow (TODO?)
-        for i in range(len(edges)):
-            try:
-                prev = edges[i]-1
-                if prev < 0:
-                    prev == 0
-                xstart = data[prev,0]
-                ystart = data[prev,1]
-                xstop = data[edges[i],0]
-                ystop = data[edges[i],1]
-                xinterp = np.linspace(xstart,xstop,nint)
-                lerp = np.interp(xinterp,[xstart,xstop],[ystart,ystop])
-                if edgetype.lower() == 'rising':
-                    tcross[i] = xinterp[np.where(lerp>=vth)[0][0]]
-                else:
-                    tcross[i] = xinterp[np.where(lerp<=vth)[0][0]]
-            except:
-                pdb.set_trace()
+        # Edges start from index 1, so the previous point always exists
+        xstart = data[edges-1,0]
+        ystart = data[edges-1,1]
+        xstop = data[edges,0]
+        ystop = data[edges,1]
+        # All edges are processed at once. The crossing is the first of the
+        # nint points of np.linspace(xstart,xstop,nint) where the linear
+        # interpolation reaches the threshold. The closed form guess of the
+        # index is corrected by one step in both directions to reproduce the
+        # rounding of np.linspace and np.interp exactly.
+        step = (xstop-xstart)/(nint-1)
+        def grid(k):
+            return np.where(k>=nint-1,xstop,k*step+xstart)
+        def reached(k):
+            x = grid(k)
+            y = np.where(x>=xstop,ystop,np.where(x==xstart,ystart,slope*(x-xstart)+ystart))
+            return y>=vth if rising else y<=vth
+        # Repeated time stamps give an infinite slope, masked out by np.where
+        with np.errstate(divide='ignore',invalid='ignore'):
+            slope = (ystop-ystart)/(xstop-xstart)
+            k = np.clip(np.ceil((vth-ystart)/(ystop-ystart)*(nint-1)),0,nint-1)
+            k = np.where((k>0) & reached(k-1),k-1,k)
+            k = np.where(reached(k),k,np.minimum(k+1,nint-1))
+        tcross = grid(k)
         # Removing edges happening before self.after
         return tcross[tcross>=self.after]
 
@@ -621,6 +650,31 @@ class spice_iofile(iofile):
             sampled[i,1] = signal[closest_idx,1]
         return sampled
 
+    def _bus_bits(self,vec,buswidth):
+        ''' Helper method to convert a vector of bus values to a matrix of bits.
+
+        Returns an array of shape (len(vec), buswidth) containing the
+        characters '0' and '1', MSB first. With ioformat 'dec' the values
+        are expected to be unsigned integers, otherwise strings of ones and
+        zeros.
+        '''
+        if self.ioformat == 'dec':
+            vals = np.asarray(vec).reshape(-1)
+            # Values that do not fit the bus would be truncated below
+            if len(vals) > 0 and (int(vals.min()) < 0 or int(vals.max()) >= 1 << buswidth):
+                self.print_log(type='F', msg='Value of IO %s does not fit in %d unsigned bits.' % (self.name,buswidth))
+            if buswidth <= 64:
+                # Unpack the big-endian bytes of each value in one go
+                bits = np.unpackbits(vals.astype('>u8').view(np.uint8).reshape(-1,8),axis=1)
+                return bits[:,-buswidth:].astype('<U1')
+            strs = np.array([format(int(v),'0%db' % buswidth) for v in vals],dtype='<U%d' % buswidth)
+        else:
+            strs = np.asarray(vec).reshape(-1).astype(str)
+            # Strings of other length would be cut or padded below
+            if np.any(np.char.str_len(strs) != buswidth):
+                self.print_log(type='F', msg='Bit string of IO %s does not match the %d bit bus.' % (self.name,buswidth))
+        return np.ascontiguousarray(strs).view('<U1').reshape(-1,buswidth)
+
     def _bin2int(self,binary,big_endian=False,signed=False):
         ''' Helper method to convert binary string to integer.
         '''
@@ -635,34 +689,31 @@ class spice_iofile(iofile):
             else:
                 return int(binary[::-1],2)
 
+    def _pad_rows(self,arr,nrows,bits=False,buswidth=None):
+        ''' Helper method to pad array to nrows rows.
+
+        The array is padded with np.nan when bits=False, and 'UUUU' when
+        bits=True. Arrays with at least nrows rows are returned as is.
+        '''
+        if arr.shape[0] >= nrows:
+            return arr
+        filler = 'U'*buswidth if bits else np.nan
+        dtype = '<U%s'%buswidth if bits else np.double
+        return np.pad(arr.astype(dtype),((0,nrows-arr.shape[0]),(0,0)),constant_values=filler)
+
     def append_to_data(self,arr=None,bits=False,buswidth=None):
         ''' Helper method to append array to self.Data.
         
         The array(s) are padded with np.nan when bits=False, and 'UUUU' when
         bits=True. This is called automatically for time and sample type IOs.
         '''
-        filler = 'U'*buswidth if bits else np.nan
-        dtype = 'S%s'%buswidth if bits else np.double
         if self.Data is None: 
             self.Data = arr
         else:
-            if len(self.Data[:,-1]) > len(arr):
-                # Old max length is bigger -> padding new array
-                padded = np.empty(self.Data[:,-1].shape,dtype=dtype).reshape(-1,1)
-                padded.fill(filler)
-                if bits: 
-                    padded = padded.astype(str)
-                padded[:arr.shape[0],:arr.shape[1]] = arr
-                arr = padded
-            elif len(self.Data[:,-1]) < len(arr):
-                # Old max length is smaller -> padding old array
-                padded = np.empty((arr.shape[0],self.Data.shape[1]),dtype=dtype)
-                padded.fill(filler)
-                if bits: 
-                    padded = padded.astype(str)
-                padded[:self.Data.shape[0],:self.Data.shape[1]] = self.Data
-                self.Data = padded
-            self.Data = np.hstack((self.Data,arr))
+            # Padding the shorter one of old and new array
+            nrows = max(self.Data.shape[0],arr.shape[0])
+            self.Data = np.hstack((self._pad_rows(self.Data,nrows,bits,buswidth),
+                                   self._pad_rows(arr,nrows,bits,buswidth)))
 
     # Remove the file when no longer needed
     def remove(self):
@@ -12,6 +12,9 @@ import sys
 from abc import * 
 from thesdk import *
 
+# Translation table for splitting bus names to name and indices
+_bus_trans = str.maketrans('<>[]:','     ')
+
 class spice_methods(metaclass=abc.ABCMeta):
 
     def filter_strobed(self, key,ioname):
@@ -26,8 +29,13 @@ class spice_methods(metaclass=abc.ABCMeta):
         If solution is found to this later from simulator
         remove this.
         """
+        arr=self.iofile_eventdict[ioname.upper()]
+        if not self.iofile_bundle.Members[key].strobe:
+            return arr
         if len(self.strobe_indices)==0:
-            tvals=self.iofile_eventdict[ioname.upper()][:,0]
+            # Contiguous copy of the time column, the scans below run
+            # over it several times
+            tvals=np.ascontiguousarray(arr[:,0])
             maxtime = np.max(tvals)
             mintime = np.min(tvals)
             for simulationcommand, simulationoption in self.simcmd_bundle.Members.items():
@@ -39,38 +47,27 @@ class spice_methods(metaclass=abc.ABCMeta):
             if not strobedelay:
                 strobedelay=0
             strobetimestamps = np.arange(mintime,maxtime,strobeperiod)+strobedelay+skipstart
-            self.strobe_indices=np.zeros(len(strobetimestamps)) # indexes to take the values
-            seg=min(300, len(strobetimestamps)) # length of a segment in the for loop (how many samples at a time)
-            idxmin=0
-            l=len(strobetimestamps)
-            nseg=l//seg # number of segments, rounded down (how many loops required)
-            idxmax=0
-            i = 0
-            for i in np.arange(1,nseg):
-                idxmax=(i-1)*seg+np.argmin(abs(tvals[(i-1)*seg:]-strobetimestamps[i*seg])) # find index of the received signal which corresponds to the largest value in reference
-                ind=idxmin+abs(strobetimestamps[seg*(i-1):seg*(i),None]-tvals[None,idxmin:idxmax]).argmin(axis=-1) # take index for the seg's values
-                idxmin=idxmax
-                self.strobe_indices[seg*(i-1):seg*i]=ind  
-            # again just in case that the loop does not overflow to take the final samples into account
-            idxmax=len(tvals)-1
-            ind=idxmin+abs(strobetimestamps[seg*(i):,None]-tvals[None,idxmin:idxmax]).argmin(axis=-1)
-            idxmin=idxmax
-            self.strobe_indices[seg*(i):]=ind
-            self.strobe_indices=self.strobe_indices.astype(int)
-            if self.iofile_bundle.Members[key].strobe:
-                new_array =self.iofile_eventdict[ioname.upper()][self.strobe_indices]
-                if len(strobetimestamps)!=len(new_array):
-                    self.print_log(type='W',
-                            msg='Oh no, something went wrong while reading the strobeperiod data')
-                    self.print_log(type='W',
-                            msg='Check data lenghts!')
+            dt=tvals[1]-tvals[0]
+            if dt > 0 and np.allclose(tvals[1:]-tvals[:-1],dt,rtol=1e-9,atol=0):
+                # Uniform time grid, the preceding point is found by division.
+                # Ties resolve to the earlier point as below.
+                idx=np.clip(((strobetimestamps-tvals[0])/dt).astype(np.intp),0,len(tvals)-2)
+                idx+=(strobetimestamps-tvals[idx]) > (tvals[idx+1]-strobetimestamps)
             else:
-                new_array =self.iofile_eventdict[ioname.upper()]
+                # Both time vectors are increasing, the nearest simulated time
+                # point of each strobe time is either at or just before its
+                # insertion index. Ties resolve to the earlier point.
+                idx=np.clip(tvals.searchsorted(strobetimestamps,side='left'),1,len(tvals)-1)
+                idx-=(strobetimestamps-tvals[idx-1]) <= (tvals[idx]-strobetimestamps)
+            self.strobe_indices=idx
+            new_array =arr[self.strobe_indices]
+            if len(strobetimestamps)!=len(new_array):
+                self.print_log(type='W',
+                        msg='Oh no, something went wrong while reading the strobeperiod data')
+                self.print_log(type='W',
+                        msg='Check data lenghts!')
         else: # We already know the strobe indices, use them!
-            if self.iofile_bundle.Members[key].strobe:
-                new_array =self.iofile_eventdict[ioname.upper()][self.strobe_indices]
-            else:
-                new_array =self.iofile_eventdict[ioname.upper()]
+            new_array =arr[self.strobe_indices]
         return new_array
 
     def check_output_accuracy(self,key):
@@ -78,8 +75,8 @@ class spice_methods(metaclass=abc.ABCMeta):
         Helper function to check output accuracy
         '''
         try:
-            tdiff = np.diff(self.iofile_eventdict[key.upper()][:,0])
-            if np.any(tdiff == 0.0):
+            tvals = self.iofile_eventdict[key.upper()][:,0]
+            if np.any(tvals[1:] == tvals[:-1]):
                     self.print_log(type='W', msg='Accuracy of output file is insufficient. Increase value of \'digits\' parameter and re-run simulation!')
         except: # Requested output wasn't in output file, do nothing
             self.print_log(type='W',msg='Couldn\'t check output file accuracy')
@@ -106,9 +103,22 @@ class spice_methods(metaclass=abc.ABCMeta):
             # busrange = range(0,9)
             
         """
-        signame = signame.replace('<',' ').replace('>',' ').replace('[',' ').replace(']',' ').replace(':',' ').split(' ')
-        if '' in signame:
-            signame.remove('')
+        return self.parse_busname(signame)[1:]
+
+    def parse_busname(self,signame):
+        """ Split signal name to the bus name and the bus indices.
+
+        Same as get_buswidth, but returns also the name of the bus::
+
+            name,start,stop,width,busrange = parse_busname('BUS<10:0>')
+            # name = 'BUS'
+            # start = 10
+            # stop = 0
+            # width = 11
+            # busrange = range(10,-1,-1)
+
+        """
+        signame = signame.translate(_bus_trans).split()
         if len(signame) == 1:
             busstart = 0
             busstop = 0
@@ -124,23 +134,25 @@ class spice_methods(metaclass=abc.ABCMeta):
         else:
             buswidth = busstop-busstart+1
             busrange = range(busstart,busstop+1)
-        return busstart,busstop,buswidth,busrange
+        return signame[0],busstart,busstop,buswidth,busrange
     
     def si_string_to_float(self, strval):
         """ Convert SI-formatted string to float
             
         E.g. self.si_string_to_float('3 mV') returns 3e-3.
         """
-        parts = strval.split()
+        # At most three parts are needed to tell a value and unit pair
+        # from other text
+        parts = strval.split(None, 2)
         if len(parts) == 2:
-            val = float(parts[0])
-            if len(parts[1]) == 1: # No prefix
+            value, unit = parts
+            val = float(value)
+            if len(unit) == 1: # No prefix
                 mult = 1
             else:
-                try:
-                    mult = self.si_prefix_mult[parts[1][0]]
-                except KeyError: # Could not convert, just return the text value
-                    self.print_log(type='W', msg='Invalid SI-prefix %s, failed to convert.' % parts[1][0])
+                mult = self.si_prefix_mult.get(unit[0])
+                if mult is None: # Could not convert, just return the text value
+                    self.print_log(type='W', msg='Invalid SI-prefix %s, failed to convert.' % unit[0])
                     return strval
             return val*mult
         else:
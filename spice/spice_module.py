@@ -7,14 +7,47 @@ Class for Spice netlist parsing.
 
 """
 import os
-import pdb
-import shutil
-import fileinput
+import mmap
 import sys
-from thesdk import *
-from spice import *
-from copy import deepcopy
+import re
+from thesdk import thesdk
 import traceback
+from functools import lru_cache
+
+@lru_cache(maxsize=None)
+def _definition_match(model, subckt_kw, name):
+    """Compiled pattern of the definition statement of subcircuit 'name',
+    i.e. the definition line and its continuation lines."""
+    start = r'^[ \t]*%s ' % re.escape('%s %s' % (subckt_kw, name))
+    if model == 'spectre':
+        # Continued with a trailing backslash
+        continued = r'(?:[^\n]*\\\n)*[^\n]*'
+    elif model in ('eldo', 'ngspice'):
+        # Continued with a leading '+', empty lines do not end the statement
+        continued = r'[^\n]*(?:\n(?:\+[^\n]*|(?=\n)|\Z))*'
+    else:
+        continued = r'(?s:.*)'
+    return re.compile(start + continued, re.IGNORECASE|re.MULTILINE)
+
+# Subcircuit definition blocks of the source netlist, from the (.)subckt line
+# until and including the first following (.)ends line.
+# Matched on the raw bytes, only the extracted blocks are decoded.
+_subckt_match = re.compile(rb'^[ \t]*(?:inline[ \t]+)?\.?subckt[ \t].*?^[ \t]*\.?ends\b[^\n]*\n?',
+        re.IGNORECASE|re.DOTALL|re.MULTILINE)
+
+@lru_cache(maxsize=128)
+def _extract_subckts(path, mtime_ns):
+    """Subcircuit definition blocks of the netlist in 'path'. Cached over
+    modules reading the same netlist, 'mtime_ns' invalidates the entry when
+    the file is modified."""
+    # Scan the mapped file, the netlist is not copied into memory.
+    # Empty files can not be mapped.
+    if os.path.getsize(path) == 0:
+        return ''
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as netlist:
+        subckts = b''.join(_subckt_match.findall(netlist)).decode('utf-8', 'replace')
+    # Binary read does not translate DOS line endings
+    return subckts.replace('\r\n', '\n')
 
 class spice_module(thesdk):
     """
@@ -32,6 +65,12 @@ class spice_module(thesdk):
         if not self.file and not self._name:
             self.print_log(type='F', msg='Either name or file must be defined')
 
+    @property
+    def DEBUG(self):
+        """ Propagates the DEBUG flag of the parent entity.
+        """
+        return getattr(self.parent, 'DEBUG', False)
+
     @property
     def file(self):
         """ Filepath to the entity's spice netlist source file 
@@ -97,18 +136,15 @@ class spice_module(thesdk):
             if os.path.isfile(self.file):
                 try:
                     self.print_log(type='D',msg='Parsing source netlist %s' % self.file)
+                    subckts = _extract_subckts(self.file, os.stat(self.file).st_mtime_ns)
                     if self.custom_subckt_name:
                         #Replace subcircuit_custom_name with parent.name
-                        self._subckt += subprocess.check_output(
-                                'sed -n \'/\.*[sS][uU][bB][cC][kK][tT]\s\s*/,/\.*[eE][nN][dD][sS]/p\' %s | sed \'s/%s/%s/g\'' 
-                                % (self.file,self.custom_subckt_name,self.parent.name), shell=True).decode('utf-8')
-                    else:
-                        self._subckt += subprocess.check_output(
-                                'sed -n \'/\.*[sS][uU][bB][cC][kK][tT]\s\s*/,/\.*[eE][nN][dD][sS]/p\' %s' 
-                                % self.file, shell=True).decode('utf-8')
-                except:
+                        subckts = subckts.replace(self.custom_subckt_name,self.parent.name)
+                    self._subckt += subckts
+                except (OSError, ValueError):
                     self.print_log(type='E',msg='Something went wrong while parsing %s.' % self.file)
-                    self.print_log(type='E',msg=traceback.format_exc())
+                    if self.DEBUG:
+                        self.print_log(type='E',msg=traceback.format_exc())
             else:
                 self.print_log(type='W',msg='File %s not found.' % self.file)
         return self._subckt
@@ -116,8 +152,10 @@ class spice_module(thesdk):
     def subckt(self,value):
         self._subckt=value
     @subckt.deleter
-    def subckt(self,value):
-        self._subckt=None
+    def subckt(self):
+        # Parsed again from the source netlist on next access
+        if hasattr(self,'_subckt'):
+            del self._subckt
 
     @property
     def instance(self):
@@ -129,74 +167,61 @@ class spice_module(thesdk):
         """
         try:
             if not hasattr(self,'_instance'):
-                subckt = self.subckt.split('\n')
-                startmatch=re.compile(r"%s %s " %(self.parent.spice_simulator.subckt, self.parent.name)
-                        ,re.IGNORECASE)
-
-                if len(subckt) <= 3:
+                subckt = self.subckt
+                # Bind the parent attributes used in the loop to locals
+                parent = self.parent
+                model = parent.model
+                name = parent.name
+                subckt_kw = parent.spice_simulator.subckt
+                commentchar = parent.spice_simulator.commentchar
+
+                # Nothing but the header comment and the empty line after it
+                if subckt.count('\n') <= 2:
                     self.print_log(type='W',msg='No subcircuit found.')
-                    self._instance = "%s Empty subcircuit\n" % (self.parent.spice_simulator.commentchar)
+                    self._instance = "%s Empty subcircuit\n" % (commentchar)
 
                 else:
-                    self._instance = "%s Subcircuit instance\n" % (self.parent.spice_simulator.commentchar)
-                    startfound = False
-                    endfound = False
-                    lastline = False
-                    for line in subckt:
-                        if startmatch.search(line) != None:
-                            startfound = True
-                            # For spectre we need to process the statline as potential endline
-                            if self.parent.model == 'spectre':
-                                if startfound and len(line) > 0:
-                                    if lastline:
-                                        endfound = True
-                                        startfound = False
-                                    if not line[-1] == '\\':
-                                        lastline = True
-                        elif startfound and len(line) > 0:
-                            if self.parent.model == 'eldo':
-                                if line[0] != '+':
-                                    endfound = True
-                                    startfound = False
-                            elif self.parent.model == 'spectre':
-                                if lastline:
-                                    endfound = True
-                                    startfound = False
-                                if not line[-1] == '\\':
-                                    lastline = True
-                            # For consistency, even though identical to eldo
-                            elif self.parent.model == 'ngspice':
-                                if line[0] != '+':
-                                    endfound = True
-                                    startfound = False
-                        if startfound and not endfound:
-                            words = line.split(" ")
-                            if words[0].lower() == self.parent.spice_simulator.subckt:
-                                if self.parent.model == 'eldo':
-                                    words[0] = "X%s%s" % (self.parent.name,'')  
-                                elif self.parent.model == 'spectre':
-                                    words[0] = "X%s%s" % (self.parent.name, ' (')
-                                elif self.parent.model == 'ngspice':
-                                    words[0] = "X%s%s" % (self.parent.name,'')  
-                                words.pop(1)
-                                line = ' '.join(words)
-                            self._instance += line + "%s\n" % (' \\' if lastline else '')
-                    if self.parent.model == 'eldo':
-                        self._instance += ('+')  + self.parent.name
-                    elif self.parent.model == 'spectre':
-                        self._instance += (') ' )  + self.parent.name
-                    elif self.parent.model == 'ngspice':
-                        self._instance += ('+')  + self.parent.name
-                return self._instance
-        except:
+                    # Collect the lines and join once, string concatenation
+                    # in the loop is quadratic in the subcircuit length
+                    parts = ["%s Subcircuit instance\n" % (commentchar)]
+                    # Model and names are fixed for the loop, resolve the
+                    # model specific syntax once
+                    instname = {'eldo' : 'X%s' % name, 'spectre' : 'X%s (' % name,
+                            'ngspice' : 'X%s' % name}.get(model)
+                    tail = {'eldo' : '+%s' % name, 'spectre' : ') %s' % name,
+                            'ngspice' : '+%s' % name}.get(model)
+                    # The definition statement is found in one scan
+                    definition = _definition_match(model, subckt_kw, name).search(subckt)
+                    lines = definition.group(0).split('\n') if definition else []
+                    if lines and model == 'spectre':
+                        # Continue the last line to the closing line
+                        lines[-1] += ' \\'
+                    if lines:
+                        # Replace the keyword and the subcircuit name of the
+                        # definition line with the instance name. Only the
+                        # first line of the statement can be the definition.
+                        head, sep, rest = lines[0].partition(' ')
+                        if head.lower() == subckt_kw:
+                            _, sep, ports = rest.partition(' ')
+                            lines[0] = (head if instname is None else instname) + sep + ports
+                    parts.extend(line + '\n' for line in lines)
+                    if tail is not None:
+                        parts.append(tail)
+                    self._instance = ''.join(parts)
+        except (OSError, ValueError):
             self.print_log(type='E',msg='Something went wrong while generating subcircuit instance.')
-            self.print_log(type='E',msg=traceback.format_exc())
+            if self.DEBUG:
+                self.print_log(type='E',msg=traceback.format_exc())
+        # Parsed only once, later accesses return the cached instance
+        return getattr(self,'_instance',None)
     @instance.setter
     def instance(self,value):
         self._instance=value
     @instance.deleter
-    def instance(self,value):
-        self._instance=None
+    def instance(self):
+        # Parsed again from subckt on next access
+        if hasattr(self,'_instance'):
+            del self._instance
 
     def export_subckts(self,**kwargs):
         """
@@ -212,16 +237,19 @@ class spice_module(thesdk):
         """
         file = kwargs.get('file')
         force = kwargs.get('force', False)
-        if not os.path.isfile(file):
+        # Exclusive create checks the existence and opens in one call
+        try:
+            module_file = open(file, "xb", buffering=1<<20)
             self.print_log(type='D',msg='Exporting spice subcircuit to %s' %(file))
-            with open(file, "w") as module_file:
-                module_file.write(self.subckt)
-        elif os.path.isfile(file) and not force:
-            self.print_log(type='F', msg=('Export target file %s exists.\n Force overwrite with force=True.' %(file)))
-        elif force:
+        except FileExistsError:
+            if not force:
+                self.print_log(type='F', msg=('Export target file %s exists.\n Force overwrite with force=True.' %(file)))
+                return
             self.print_log(type='I',msg='Forcing overwrite of spice subcircuit to %s.' %(file))
-            with open(file, "w") as module_file:
-                module_file.write(self.subckt)
+            module_file = open(file, "wb", buffering=1<<20)
+        # Encoded once and written as bytes, bypassing the text layer
+        with module_file:
+            module_file.write(self.subckt.encode('utf-8'))
 
 if __name__=="__main__":
     pass
@@ -16,7 +16,6 @@ from thesdk import *
 from thesdk.iofile import iofile
 import numpy as np
 import pandas as pd
-import pdb
 
 class spice_simcmd(thesdk):
     """
@@ -172,54 +171,58 @@ class spice_simcmd(thesdk):
 
     """
 
-    @property
-    def _classfile(self):
-        return os.path.dirname(os.path.realpath(__file__)) + "/"+__name__
+    # Scalar parameters and their defaults, see Attributes above.
+    # The sweep parameters, given as a value or a list, are handled in __init__.
+    _parameters = (
+            ('sim', 'tran'),
+            ('tprint', 1e-12),
+            ('tstop', None),
+            ('uic', False),
+            ('noise', False),
+            ('fmin', 1),
+            ('fmax', 5e9),
+            ('fscale', 'log'),
+            ('fpoints', 0),
+            ('fstepsize', 0),
+            ('seed', None),
+            ('method', None),
+            ('cmin', None),
+            ('mc', False),
+            ('mc_seed', None),
+            ('model_info', False),
+            ('step', None),
+            ('maxstep', None),
+            ('strobeperiod', None),
+            ('strobedelay', None),
+            ('skipstart', None),
+            )
+
+    # Resolved once at import, the path does not change per instance
+    _classfile = os.path.dirname(os.path.realpath(__file__)) + "/"+__name__
 
     def __init__(self,parent,**kwargs):
         try:
             self.parent = parent
-            self.sim = kwargs.get('sim','tran')
             self.plotlist = kwargs.get('plotlist',[])
             self.excludelist = kwargs.get('excludelist',[])
-            self.tprint = kwargs.get('tprint',1e-12)
-            self.tstop = kwargs.get('tstop',None)
-            self.uic = kwargs.get('uic',False)
-            self.noise = kwargs.get('noise',False)
-            self.fmin = kwargs.get('fmin',1)
-            self.fmax = kwargs.get('fmax',5e9)
-            self.fscale = kwargs.get('fscale','log')
-            self.fpoints = kwargs.get('fpoints',0)
-            self.fstepsize = kwargs.get('fstepsize',0)
-            self.seed = kwargs.get('seed',None)
-            self.method = kwargs.get('method',None)
-            self.cmin = kwargs.get('cmin',None)
-            self.mc = kwargs.get('mc',False)
-            self.mc_seed = kwargs.get('mc_seed',None)
-            self.model_info = kwargs.get('model_info', False)
-            self.step = kwargs.get('step', None)
-            self.maxstep = kwargs.get('maxstep', None)
-            self.strobeperiod = kwargs.get('strobeperiod', None)
-            self.strobedelay = kwargs.get('strobedelay', None)
-            self.skipstart = kwargs.get('skipstart', None)
+            for name, default in self._parameters:
+                setattr(self, name, kwargs.get(name, default))
             # Make list, if they are not already
-            self.sweep = kwargs.get('sweep',[]) if type(kwargs.get('sweep', [])) == list else [kwargs.get('sweep')]
-            self.subcktname = kwargs.get('subcktname',[]) if type(kwargs.get('subcktname', [])) == list else [kwargs.get('subcktname')]
-            self.devname = kwargs.get('devname',[]) if type(kwargs.get('devname', [])) == list else [kwargs.get('devname')]
-            self.swpstart = kwargs.get('swpstart',[]) if type(kwargs.get('swpstart', [])) == list else [kwargs.get('swpstart')]
-            self.swpstop = kwargs.get('swpstop',[]) if type(kwargs.get('swpstop', [])) == list else [kwargs.get('swpstop')]
-            self.swpstep = kwargs.get('swpstep',[]) if type(kwargs.get('swpstep', [])) == list else [kwargs.get('swpstep')]
+            for name in ('sweep', 'subcktname', 'devname', 'swpstart', 'swpstop', 'swpstep'):
+                value = kwargs.get(name, [])
+                setattr(self, name, value if isinstance(value, list) else [value])
         except:
             self.print_log(type='E',msg=traceback.format_exc())
             self.print_log(type='F', msg="Simulation command definition failed.")
-        if hasattr(self.parent,'simcmd_bundle'):
+        parent = self.parent
+        simcmd_bundle = getattr(parent,'simcmd_bundle',None)
+        if simcmd_bundle is not None:
             # This limits it to 1 of each simulation type. Is this ok?
-            self.parent.simcmd_bundle.new(name=self.sim,val=self)
-        if self.sim == 'dc' and self.parent.model=='spectre':
+            simcmd_bundle.new(name=self.sim,val=self)
+        if self.sim == 'dc' and parent.model=='spectre':
             self.print_log(type='I', msg='Saving results in human-readable format (requirement for DC simulation)!')
-            self.parent.spiceoptions.update({'rawfmt': 'psfascii'})
-        if len(self.subcktname) != 0 and len(self.devname) != 0:
+            parent.spiceoptions.update({'rawfmt': 'psfascii'})
+        if self.subcktname and self.devname:
             self.print_log(type='F', msg='Cannot specify subckt sweep and device sweep in the same simcmd instance!')
-        if self.strobeperiod and self.strobedelay:
-            if self.strobedelay > self.strobeperiod:
-                self.print_log(type='F', msg='Strobedelay cannot be larger than strobeperiod!')
+        if self.strobeperiod and self.strobedelay and self.strobedelay > self.strobeperiod:
+            self.print_log(type='F', msg='Strobedelay cannot be larger than strobeperiod!')
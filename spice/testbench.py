@@ -10,7 +10,6 @@ import os
 import sys
 import subprocess
 import shlex
-import fileinput
 import shutil
 from thesdk import *
 from spice.testbench_common import testbench_common
@@ -18,7 +17,6 @@ from spice.ngspice.ngspice_testbench import ngspice_testbench
 from spice.eldo.eldo_testbench import eldo_testbench
 from spice.spectre.spectre_testbench import spectre_testbench
 from spice.spice_module import spice_module
-import pdb
 
 import numpy as np
 import pandas as pd
@@ -95,9 +93,10 @@ class testbench(testbench_common):
         the parent entity.
         """
         if not hasattr(self,'_parameters'):
+            parameter = self.parent.spice_simulator.parameter
             self._parameters = "%s Parameters\n" % self.parent.spice_simulator.commentchar
-            for parname,parval in self.parent.spiceparameters.items():
-                self._parameters += self.parent.spice_simulator.parameter + ' ' + str(parname) + "=" + str(parval) + "\n"
+            self._parameters += ''.join(parameter + ' ' + str(parname) + "=" + str(parval) + "\n"
+                    for parname,parval in self.parent.spiceparameters.items())
         return self._parameters
     @parameters.setter
     def parameters(self,value):
@@ -159,19 +158,21 @@ class testbench(testbench_common):
         """
         if not hasattr(self,'_dspfincludecmd'):
             if len(self.parent.dspf) > 0:
-                self.copy_dspf()
                 self.print_log(type='I',msg='Including exctracted parasitics from DSPF.')
                 self._dspfincludecmd = "%s Extracted parasitics\n"  % self.parent.spice_simulator.commentchar
-                origcellmatch = re.compile(r"DESIGN")
                 for cellname in self.parent.dspf:
+                    srcpath = os.path.join(self.parent.spicesrcpath, '%s.pex.dspf' % cellname)
                     dspfpath = '%s/%s.pex.dspf' % (self.parent.spicesimpath,cellname)
                     try:    
                         found = False
-                        with open(dspfpath) as dspffile:
-                            lines = dspffile.readlines()
-                            for line in lines:
+                        with open(srcpath) as dspffile:
+                            # Stream the lines, DESIGN is in the header
+                            header = []
+                            for line in dspffile:
+                                header.append(line)
                                 # This mathch only check if there is a DESIGN in dpsf file.
-                                if origcellmatch.search(line) != None:
+                                # Plain substring test, no regex needed for a literal.
+                                if 'DESIGN' in line:
                                     words = line.split()
                                     cellname = words[-1].replace('\"','')
                                     if cellname.lower() == self.parent.name.lower():
@@ -186,10 +187,16 @@ class testbench(testbench_common):
                                     break
                             if found:
                                 # Match is case insensitive, we will rename for perfect match.
+                                # The renamed DSPF is written to the simulation path
+                                # while copying. The header lines are already read,
+                                # the rest is streamed from the same handle, so the
+                                # source is read only once.
                                 self.print_log(type='I',msg='Renaming DSPF top cell name accordingly from "%s" to "%s".' % (cellname,self.parent.name))
-                                with fileinput.FileInput(dspfpath,inplace=True,backup='.bak') as f:
-                                    for line in f:
-                                        print(line.replace(self._origcellname,self.parent.name),end='')
+                                with open(dspfpath,'w',buffering=1<<20) as dest:
+                                    for line in header:
+                                        dest.write(line.replace(self._origcellname,self.parent.name))
+                                    for line in dspffile:
+                                        dest.write(line.replace(self._origcellname,self.parent.name))
                             else:
                                 self.print_log(type='F',msg='No DESIGN string in DSPF matching %s or %s. Aborting' %(self.parent.name, self.dut.custom_subckt_name))
 
@@ -210,7 +217,7 @@ class testbench(testbench_common):
                             self._dspfincludecmd += "%s \"%s\"\n" % (self.parent.spice_simulator.dspfinclude,dspfpath)
                         else:
                             self.print_log(type='W',msg='No such file or directory %s.'%dspfpath)
-            return self._dspfincludecmd
+        return self._dspfincludecmd
     @dspfincludecmd.setter
     def dspfincludecmd(self,value):
         self._dspfincludecmd=value
@@ -228,8 +235,7 @@ class testbench(testbench_common):
         if not hasattr(self,'_misccmd'):
             self._misccmd="%s Manual commands\n" % (self.parent.spice_simulator.commentchar)
             mcmd = self.parent.spicemisc
-            for cmd in mcmd:
-                self._misccmd += cmd + "\n"
+            self._misccmd += ''.join(cmd + "\n" for cmd in mcmd)
         return self._misccmd
     @misccmd.setter
     def misccmd(self,value):
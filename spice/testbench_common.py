@@ -15,7 +15,6 @@ from abc import *
 from thesdk import *
 from spice import *
 from spice.spice_module import spice_module
-import pdb
 
 import numpy as np
 import pandas as pd